@@ -1,75 +1,593 @@
-from functools import cache
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+import os
 from pathlib import Path
 import random
-from typing import Collection, Dict, List
+import tempfile
+from typing import Callable, Collection, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
-from pandas import DataFrame, Series
+import numpy
 import pooch
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+
+# letters used less often than this are left out of word letter scores
+MINIMUM_LETTER_PROBABILITY = 1e-3
+
+# number of most recently used word choices kept by each index of words, keyed by their constraints
+WORD_CHOICES_CACHE_SIZE = 4
+
+
+def five_letter_words_english_filename() -> Path:
+    """
+    :return: path to the cached list of five-letter English words from Stanford
+    """
+
+    return Path(
+        pooch.retrieve(
+            'https://www-cs-faculty.stanford.edu/~knuth/sgb-words.txt',
+            known_hash='52a04f4fb860953c2a29c2769014bd8b12d090a19e7577a460a2a2586bd6d4ce',
+        )
+    )
+
 
 @cache
-def five_letter_words_english() -> Series:
+def five_letter_words_english_matrix() -> numpy.ndarray:
+    """
+    preprocess the Stanford word list once into an N x 5 matrix of ASCII codes, stored next to the word list
+
+    :return: memory-mapped N x 5 matrix of the ASCII codes of five-letter English words from Stanford
+    """
+
+    words_filename = five_letter_words_english_filename()
+    matrix_filename = words_filename.with_suffix('.u8.npy')
+
+    if not matrix_filename.exists():
+        save_array(matrix_filename, letter_matrix(words_filename.read_text().splitlines()))
+
+    return validate_letter_matrix(numpy.load(matrix_filename, mmap_mode='r'))
+
+
+@cache
+def five_letter_words_english() -> numpy.ndarray:
     """
     :return: a list of five-letter English words from Stanford
     """
 
-    words_filename = pooch.retrieve(
-        'https://www-cs-faculty.stanford.edu/~knuth/sgb-words.txt',
-        known_hash='52a04f4fb860953c2a29c2769014bd8b12d090a19e7577a460a2a2586bd6d4ce',
+    matrix = five_letter_words_english_matrix()
+    return matrix.view('S5')[:, 0].astype(str)
+
+
+@cache
+def five_letter_words_english_scores() -> numpy.ndarray:
+    """
+    :return: letter scores of the five-letter English words from Stanford
+    """
+
+    return word_letter_scores(five_letter_words_english_matrix())
+
+
+def save_array(filename: Path, array: numpy.ndarray):
+    """
+    write an array to a temporary file next to the given filename and move it into place, so that an interrupted write never leaves a partial file behind
+
+    :param filename: path to `.npy` file
+    :param array: array to save
+    """
+
+    with tempfile.NamedTemporaryFile(
+        dir=filename.parent, prefix=f'{filename.stem}.', suffix='.npy', delete=False
+    ) as temporary_file:
+        temporary_filename = temporary_file.name
+        try:
+            numpy.save(temporary_file, array)
+            # temporary files are only readable by their owner; use the permissions of a regular new file
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temporary_filename, 0o666 & ~umask)
+        except BaseException:
+            temporary_file.close()
+            os.remove(temporary_filename)
+            raise
+
+    os.replace(temporary_filename, filename)
+
+
+def letter_matrix(words: Collection[str]) -> numpy.ndarray:
+    """
+    :param words: list of five-letter strings
+    :return: N x 5 matrix of the ASCII codes of each letter
+    """
+
+    if any(len(word) != 5 for word in words):
+        raise ValueError('words must all be five letters long')
+
+    matrix = numpy.frombuffer(''.join(words).encode('ascii'), dtype=numpy.uint8).reshape(-1, 5)
+    return validate_letter_matrix(matrix)
+
+
+def validate_letter_matrix(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    :param matrix: N x 5 matrix of ASCII codes
+    :return: the given matrix, if it only holds the ASCII codes of lowercase letters from "a" to "z"
+    """
+
+    if matrix.dtype != numpy.uint8 or matrix.ndim != 2 or matrix.shape[1] != 5:
+        raise ValueError(f'expected an N x 5 matrix of uint8, not {matrix.shape} of {matrix.dtype}')
+    if ((matrix < ord('a')) | (matrix > ord('z'))).any():
+        raise ValueError('words must only contain lowercase letters from "a" to "z"')
+
+    return matrix
+
+
+def letter_bits(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    :param matrix: N x 5 matrix of ASCII codes
+    :return: bitmask of the letters of the alphabet present within each word, with bit 0 for 'a' through bit 25 for 'z'
+    """
+
+    bits = numpy.zeros(matrix.shape[0], dtype=numpy.uint32)
+    for index in range(matrix.shape[1]):
+        bits |= numpy.left_shift(numpy.uint32(1), matrix[:, index] - ord('a'), dtype=numpy.uint32)
+    return bits
+
+
+def letter_probabilities(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    :param matrix: N x 5 matrix of ASCII codes
+    :return: probability of use out of 1 of each letter of the alphabet
+    """
+
+    counts = numpy.bincount(matrix.ravel(), minlength=ord('z') + 1)[ord('a') : ord('z') + 1]
+    letters = counts.astype(numpy.float64)
+    letters /= letters.sum()
+
+    return letters
+
+
+def word_letter_scores(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    :param matrix: N x 5 matrix of ASCII codes
+    :return: probability of use of the distinct letters of each word
+    """
+
+    probabilities = letter_probabilities(matrix)
+    # rare letters contribute next to nothing to the score, so leave them out of the product
+    letters = numpy.flatnonzero(probabilities >= MINIMUM_LETTER_PROBABILITY).astype(numpy.uint32)
+
+    presence = letter_bits(matrix)[:, None] >> letters
+    presence &= 1
+
+    scores = presence.astype(numpy.float64) @ probabilities[letters]
+    scores /= scores.sum()
+
+    return scores
+
+
+@njit(cache=True)
+def constraint_mask(
+    matrix: numpy.ndarray,
+    in_place_indices: numpy.ndarray,
+    in_place_characters: numpy.ndarray,
+    out_of_place_indices: numpy.ndarray,
+    out_of_place_characters: numpy.ndarray,
+    minimum_counts: numpy.ndarray,
+    maximum_counts: numpy.ndarray,
+) -> numpy.ndarray:
+    """
+    evaluate all constraints on each word in a single pass over the letter matrix
+
+    :param matrix: N x 5 matrix of ASCII codes
+    :param in_place_indices: indices within the word that must hold the corresponding character
+    :param in_place_characters: ASCII codes of characters that must exist at the corresponding index
+    :param out_of_place_indices: indices within the word that must NOT hold the corresponding character
+    :param out_of_place_characters: ASCII codes of characters that must NOT exist at the corresponding index
+    :param minimum_counts: minimum number of occurrences of each letter of the alphabet within the word
+    :param maximum_counts: maximum number of occurrences of each letter of the alphabet within the word
+    :return: boolean mask of words fitting the given constraints
+    """
+
+    mask = numpy.zeros(matrix.shape[0], dtype=numpy.bool_)
+    counts = numpy.zeros(26, dtype=numpy.int8)
+
+    for word_index in range(matrix.shape[0]):
+        word = matrix[word_index]
+
+        keep = True
+        for constraint_index in range(in_place_indices.shape[0]):
+            if word[in_place_indices[constraint_index]] != in_place_characters[constraint_index]:
+                keep = False
+                break
+        if not keep:
+            continue
+
+        for constraint_index in range(out_of_place_indices.shape[0]):
+            if (
+                word[out_of_place_indices[constraint_index]]
+                == out_of_place_characters[constraint_index]
+            ):
+                keep = False
+                break
+        if not keep:
+            continue
+
+        # words with bytes outside of "a" to "z" never fit; keep this check, since Numba does not
+        # check bounds and such a byte would otherwise index outside of the letter counts
+        counts[:] = 0
+        for letter_index in range(word.shape[0]):
+            letter = word[letter_index] - 97
+            if letter < 0 or letter >= 26:
+                keep = False
+                break
+            counts[letter] += 1
+        if not keep:
+            continue
+
+        for letter in range(26):
+            if counts[letter] < minimum_counts[letter] or counts[letter] > maximum_counts[letter]:
+                keep = False
+                break
+
+        mask[word_index] = keep
+
+    return mask
+
+
+class WordConstraints(NamedTuple):
+    """
+    hashable set of constraints on the letters of a word
+    """
+
+    in_place: FrozenSet[Tuple[int, str]]
+    out_of_place: FrozenSet[Tuple[int, str]]
+    minimum_counts: Tuple[int, ...]
+    maximum_counts: Tuple[int, ...]
+
+    @classmethod
+    def from_guesses(
+        cls,
+        in_place: Dict[int, str],
+        out_of_place: Dict[int, List[str]],
+        not_in_word: Collection[str],
+    ) -> 'WordConstraints':
+        """
+        :param in_place: mapping of indices within the word to a character that exists there within the word
+        :param out_of_place: mapping of indices within the word to a list of characters that does NOT exist there, but still exists within the word
+        :param not_in_word: list of characters that do NOT exist within the word
+        :return: constraints on the letters of the word
+        """
+
+        in_word = list(in_place.values())
+        for index, characters in out_of_place.items():
+            in_word.extend(characters)
+
+        for index in [*in_place, *out_of_place]:
+            if not 0 <= index < 5:
+                raise ValueError(f'index {index} is not within a five-letter word')
+        for character in [*in_word, *not_in_word]:
+            if len(character) != 1 or not 'a' <= character <= 'z':
+                raise ValueError(f'"{character}" is not a lowercase letter from "a" to "z"')
+
+        minimum_counts = [0] * 26
+        maximum_counts = [5] * 26
+        for character in in_word:
+            minimum_counts[ord(character) - ord('a')] = 1
+        for character in not_in_word:
+            maximum_counts[ord(character) - ord('a')] = in_word.count(character)
+
+        return cls(
+            in_place=frozenset(in_place.items()),
+            out_of_place=frozenset(
+                (index, character)
+                for index, characters in out_of_place.items()
+                for character in characters
+            ),
+            minimum_counts=tuple(minimum_counts),
+            maximum_counts=tuple(maximum_counts),
+        )
+
+    def refines(self, other: 'WordConstraints') -> bool:
+        """
+        :param other: constraints on the letters of a word
+        :return: whether every word fitting these constraints also fits the other constraints
+        """
+
+        return (
+            self.in_place >= other.in_place
+            and self.out_of_place >= other.out_of_place
+            and all(
+                minimum >= other_minimum
+                for minimum, other_minimum in zip(self.minimum_counts, other.minimum_counts)
+            )
+            and all(
+                maximum <= other_maximum
+                for maximum, other_maximum in zip(self.maximum_counts, other.maximum_counts)
+            )
+        )
+
+    @property
+    def required_letters(self) -> List[int]:
+        """
+        :return: ASCII codes of letters that must exist within the word
+        """
+
+        return [
+            ord('a') + letter for letter, minimum in enumerate(self.minimum_counts) if minimum > 0
+        ]
+
+    def since(self, previous: 'WordConstraints') -> 'WordConstraints':
+        """
+        :param previous: constraints that words have already been filtered by
+        :return: only the constraints that were added or tightened since the previous constraints
+        """
+
+        return WordConstraints(
+            in_place=self.in_place - previous.in_place,
+            out_of_place=self.out_of_place - previous.out_of_place,
+            minimum_counts=tuple(
+                minimum if minimum > previous_minimum else 0
+                for minimum, previous_minimum in zip(self.minimum_counts, previous.minimum_counts)
+            ),
+            maximum_counts=tuple(
+                maximum if maximum < previous_maximum else 5
+                for maximum, previous_maximum in zip(self.maximum_counts, previous.maximum_counts)
+            ),
+        )
+
+
+@dataclass(eq=False)
+class WordIndex:
+    """
+    letter matrix of a list of words, along with statistics precomputed once to filter it and its most recently used word choices
+
+    build with ``WordIndex.from_matrix``, which rejects bytes outside "a" to "z"
+    """
+
+    matrix: numpy.ndarray
+    letter_words: numpy.ndarray
+    containing: numpy.ndarray
+    at_index: numpy.ndarray
+    choices: 'OrderedDict[WordConstraints, numpy.ndarray]' = field(
+        default_factory=OrderedDict, repr=False
     )
 
-    return Series(Path(words_filename).read_text().splitlines(), dtype='string')
+    @classmethod
+    def from_matrix(cls, matrix: numpy.ndarray) -> 'WordIndex':
+        """
+        :param matrix: N x 5 matrix of ASCII codes
+        :return: index of the words in the given letter matrix
+        """
+
+        validate_letter_matrix(matrix)
+
+        bits = letter_bits(matrix)
+        presence = ((bits >> numpy.arange(26, dtype=numpy.uint32)[:, None]) & 1).astype(bool)
+        at_index = numpy.stack(
+            [
+                numpy.bincount(column, minlength=ord('z') + 1)[ord('a') : ord('z') + 1]
+                for column in matrix.T
+            ]
+        )
+
+        return cls(
+            matrix=matrix,
+            # 26 x ceil(N / 8) packed bitmaps of the words containing each letter of the alphabet
+            letter_words=numpy.packbits(presence, axis=1),
+            # number of words containing each letter of the alphabet
+            containing=presence.sum(axis=1),
+            # 5 x 26 number of words with each letter of the alphabet at each index
+            at_index=at_index,
+        )
+
+    def recall_choices(self, constraints: WordConstraints) -> Optional[numpy.ndarray]:
+        """
+        :param constraints: constraints on the letters of the word
+        :return: indices of words previously found to fit the given constraints, if still cached
+        """
+
+        if constraints not in self.choices:
+            return None
+        self.choices.move_to_end(constraints)
+        return self.choices[constraints]
+
+    def remember_choices(self, constraints: WordConstraints, kept: numpy.ndarray):
+        """
+        cache the indices of words fitting the given constraints, evicting the least recently used word choices
+
+        :param constraints: constraints on the letters of the word
+        :param kept: indices of words fitting the given constraints
+        """
+
+        self.choices[constraints] = kept
+        if len(self.choices) > WORD_CHOICES_CACHE_SIZE:
+            self.choices.popitem(last=False)
+
+
+@cache
+def five_letter_words_english_index() -> WordIndex:
+    """
+    :return: index of the five-letter English words from Stanford
+    """
+
+    return WordIndex.from_matrix(five_letter_words_english_matrix())
 
 
-def letter_probabilities(words: Series) -> Series:
+def selective_order(
+    constraints: WordConstraints, words: WordIndex
+) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
     """
-    :param words: Series of strings
-    :return: letters with their probability of use out of 1
+    :param constraints: constraints on the letters of the word
+    :param words: index of words
+    :return: in-place and out-of-place constraints, each ordered from the fewest to the most expected matching words
     """
 
-    if not isinstance(words, Series):
-        words = Series(words, dtype='string')
+    in_place = sorted(
+        sorted(constraints.in_place),
+        key=lambda pair: words.at_index[pair[0], ord(pair[1]) - ord('a')],
+    )
+    out_of_place = sorted(
+        sorted(constraints.out_of_place),
+        key=lambda pair: -words.at_index[pair[0], ord(pair[1]) - ord('a')],
+    )
+    return in_place, out_of_place
+
+
+def selective_checks(constraints: WordConstraints, words: WordIndex) -> Tuple[Tuple, ...]:
+    """
+    :param constraints: constraints on the letters of the word
+    :param words: index of words used to estimate how selective each constraint is
+    :return: positional, required letter, and letter count checks, ordered from the fewest to the most expected matching words
+    """
 
-    letters = Series(
-        {letter: words.str.count(letter).sum() for letter in 'abcdefghijklmnopqurstuvwxyz'}
+    total = words.matrix.shape[0]
+    in_place, out_of_place = selective_order(constraints, words)
+
+    # pairs of the expected number of matching words and the check
+    checks = []
+    for index, character in in_place:
+        checks.append(
+            (
+                words.at_index[index, ord(character) - ord('a')],
+                ('in_place', index, ord(character)),
+            )
+        )
+    for index, character in out_of_place:
+        checks.append(
+            (
+                total - words.at_index[index, ord(character) - ord('a')],
+                ('out_of_place', index, ord(character)),
+            )
+        )
+
+    required = tuple(constraints.required_letters)
+    if 0 < len(required) <= 5:
+        checks.append(
+            (
+                min(words.containing[character - ord('a')] for character in required),
+                ('required', required),
+            )
+        )
+
+    limited = tuple(
+        (ord('a') + letter, maximum)
+        for letter, maximum in enumerate(constraints.maximum_counts)
+        if 0 < maximum < 5
     )
+    if len(limited) > 0:
+        checks.append((total, ('limited', limited)))
 
-    return letters / letters.sum()
+    return tuple(check for _, check in sorted(checks, key=lambda expected_check: expected_check[0]))
 
 
-def word_letter_scores(words: Series) -> Series:
+@lru_cache(maxsize=4)
+def constraint_predicate(checks: Tuple[Tuple, ...]) -> Callable[[numpy.ndarray], numpy.ndarray]:
     """
-    :param words: Series of words
-    :return: words with their probability of use of distinct letters
+    generate and compile a NumPy function specialized to the given checks, applying them in order so later checks only see the words that remain
+
+    :param checks: ordered positional, required letter, and letter count checks
+    :return: function of an N x 5 matrix of ASCII codes that returns the indices of words passing the given checks
     """
 
-    letters = letter_probabilities(words)
+    namespace = {'numpy': numpy}
+    lines = ['def predicate(words):', '    kept = numpy.arange(words.shape[0])']
+
+    for kind, *arguments in checks:
+        if kind == 'in_place':
+            index, character = arguments
+            check = f'words[kept, {index}] == {character}'
+        elif kind == 'out_of_place':
+            index, character = arguments
+            check = f'words[kept, {index}] != {character}'
+        elif kind == 'required':
+            namespace['required'] = numpy.array(arguments[0], dtype=numpy.uint8)
+            check = '(words[kept][:, :, None] == required).any(axis=1).all(axis=1)'
+        else:
+            namespace['limited'], namespace['maxima'] = numpy.array(
+                arguments[0], dtype=numpy.uint8
+            ).T
+            check = (
+                '((words[kept][:, :, None] == limited).sum(axis=1, dtype=numpy.uint8) <= maxima)'
+                '.all(axis=1)'
+            )
+        lines.append(f'    kept = kept[{check}]')
+
+    lines.append('    return kept')
 
-    weighted_indices = Series(0, index=words.values)
-    for letter, probability in letters.items():
-        weighted_indices += words.str.contains(letter).values * probability
+    exec(compile('\n'.join(lines), '<constraint predicate>', 'exec'), namespace)
+    return namespace['predicate']
 
-    return weighted_indices / weighted_indices.sum()
 
+def constraint_indices(
+    words: WordIndex, constraints: WordConstraints, kept: numpy.ndarray = None
+) -> numpy.ndarray:
+    """
+    filter rows of the letter matrix based on constraints
 
-def word_choices(
-    words: Series,
+    :param words: index of words
+    :param constraints: constraints on the letters of the word
+    :param kept: indices of rows to consider (defaults to all rows)
+    :return: indices of rows fitting the given constraints
+    """
+
+    matrix = words.matrix
+    if kept is None:
+        kept = numpy.arange(matrix.shape[0], dtype=numpy.int32)
+
+    if NUMBA_AVAILABLE:
+        in_place, out_of_place = selective_order(constraints, words)
+        mask = constraint_mask(
+            matrix[kept],
+            numpy.array([index for index, _ in in_place], dtype=numpy.int8),
+            numpy.array([ord(character) for _, character in in_place], dtype=numpy.uint8),
+            numpy.array([index for index, _ in out_of_place], dtype=numpy.int8),
+            numpy.array([ord(character) for _, character in out_of_place], dtype=numpy.uint8),
+            numpy.array(constraints.minimum_counts, dtype=numpy.int8),
+            numpy.array(constraints.maximum_counts, dtype=numpy.int8),
+        )
+        kept = kept[mask]
+    else:
+        # excluded letters are usually the most selective, so prune them first over all words
+        alive = numpy.full(words.letter_words.shape[1], 0xFF, dtype=numpy.uint8)
+        for letter, maximum in enumerate(constraints.maximum_counts):
+            if maximum == 0:
+                alive &= ~words.letter_words[letter]
+        # more required letters than fit in a word are checked against the packed bitmaps instead
+        if len(constraints.required_letters) > matrix.shape[1]:
+            for character in constraints.required_letters:
+                alive &= words.letter_words[character - ord('a')]
+        kept = kept[numpy.unpackbits(alive, count=matrix.shape[0]).view(bool)[kept]]
+
+        kept = kept[constraint_predicate(selective_checks(constraints, words))(matrix[kept])]
+
+    return kept
+
+
+def filter_words(
+    words: WordIndex,
     in_place: Dict[int, str] = None,
     out_of_place: Dict[int, List[str]] = None,
     not_in_word: Collection[str] = None,
-) -> Series:
+) -> numpy.ndarray:
     """
-    filter words based on parameters
+    filter words based on parameters, starting from previous results where the new parameters only add constraints
 
-    :param words: Series of strings
+    :param words: index of words
     :param in_place: mapping of indices within the word to a character that exists there within the word
     :param out_of_place: mapping of indices within the word to a list of characters that does NOT exist there, but still exists within the word
     :param not_in_word: list of characters that do NOT exist within the word
-    :return: list of words fitting the given parameters
+    :return: boolean mask of words fitting the given parameters
     """
 
-    if not isinstance(words, Series):
-        words = Series(words, dtype='string')
     if in_place is None:
         in_place = {}
     if out_of_place is None:
@@ -77,22 +595,28 @@ def word_choices(
     if not_in_word is None:
         not_in_word = []
 
-    in_word = list(in_place.values())
-    for index, characters in out_of_place.items():
-        in_word.extend(characters)
+    constraints = WordConstraints.from_guesses(in_place, out_of_place, not_in_word)
 
-    for index, character in in_place.items():
-        words = words[words.str.get(index) == character]
-    for character in in_word:
-        words = words[words.str.contains(character)]
-    for character in not_in_word:
-        threshold = in_word.count(character)
-        words = words[words.str.count(character) <= threshold]
-    for index, characters in out_of_place.items():
-        for character in characters:
-            words = words[words.str.get(index) != character]
+    kept = words.recall_choices(constraints)
+    if kept is None:
+        # start from the fewest previous choices that these constraints only tighten
+        previous = None
+        for cached_constraints, cached_kept in words.choices.items():
+            if constraints.refines(cached_constraints) and (
+                previous is None or len(cached_kept) < len(words.choices[previous])
+            ):
+                previous = cached_constraints
 
-    return words
+        if previous is None:
+            kept = constraint_indices(words, constraints)
+        else:
+            kept = constraint_indices(words, constraints.since(previous), words.choices[previous])
+
+        words.remember_choices(constraints, kept)
+
+    mask = numpy.full(words.matrix.shape[0], False)
+    mask[kept] = True
+    return mask
 
 
 if __name__ == '__main__':
@@ -102,37 +626,37 @@ if __name__ == '__main__':
 
     # get list of five-letter words sorted by their use in language
     words = five_letter_words_english()
+    word_index = five_letter_words_english_index()
 
-    # sort word list by combined distinct probability score
-    words = DataFrame(
-        {'word': words.values, 'letter_score': word_letter_scores(words).values},
-        index=words.index,
-    )
+    # combined distinct probability score of each word
+    scores = five_letter_words_english_scores()
+    # indices of words from highest to lowest letter score
+    score_order = numpy.argsort(-scores, kind='stable').astype(numpy.int32)
+
+    alive = numpy.full(len(words), True)
 
     # main loop
     while True:
-        words = words.loc[
-            word_choices(words['word'], in_place, out_of_place, not_in_word).index
-        ]
+        # word choices start from those of the last turn, so only new constraints are applied
+        alive &= filter_words(word_index, in_place, out_of_place, not_in_word)
+        kept = numpy.flatnonzero(alive)
 
-        message = f'word list: {len(words)} words'
-        if len(words) <= 200:
-            print(f'{message} - {words["word"].tolist()}')
+        message = f'word list: {len(kept)} words'
+        if len(kept) <= 200:
+            print(f'{message} - {words[kept].tolist()}')
         else:
             print(message)
 
-        if len(words) <= 1:
-            if len(words) == 1:
-                print(f'the word should be "{words.iloc[0]["word"]}"')
+        if len(kept) <= 1:
+            if len(kept) == 1:
+                print(f'the word should be "{words[kept[0]]}"')
             break
 
         # skip the first few most commonly-used words
-        highest_letter_score_word = words[
-            words['letter_score'] == words['letter_score'].max()
-        ].iloc[0]['word']
-        most_used_word = words.iloc[0]['word']
+        highest_letter_score_word = words[score_order[alive[score_order]][0]]
+        most_used_word = words[kept[0]]
         print(f'highest letter score word: "{highest_letter_score_word}"')
-        print(f'random word: "{words.loc[random.choice(words.index), "word"]}"')
+        print(f'random word: "{words[random.choice(kept)]}"')
         print(f'most-used word: "{most_used_word}"')
 
         green = input(f'capitalize the green letters of your word choice: ').strip()
@@ -140,10 +664,21 @@ if __name__ == '__main__':
             green = most_used_word
 
         word = green.lower()
-        if len(green) > 0 and all(character.isupper() for character in green):
+        if len(word) != 5 or any(not 'a' <= character <= 'z' for character in word):
+            print(f'"{green}" is not a five-letter word')
+            continue
+
+        if all(character.isupper() for character in green):
             print(f'the word is "{word}"')
             break
 
+        yellow = input(
+            f'capitalize the yellow letters of your word choice ("{word}"): '
+        ).strip()
+        if len(yellow) > 0 and yellow.lower() != word:
+            print(f'"{yellow}" is not the word "{word}"')
+            continue
+
         in_word_indices = set()
         for index, letter in enumerate(green):
             if letter.isupper():
@@ -151,9 +686,6 @@ if __name__ == '__main__':
                 in_place[index] = letter
                 in_word_indices.add(index)
 
-        yellow = input(
-            f'capitalize the yellow letters of your word choice ("{word}"): '
-        ).strip()
         for index, letter in enumerate(yellow):
             if letter.isupper():
                 letter = letter.lower()